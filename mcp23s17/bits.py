@@ -0,0 +1,30 @@
+from collections.abc import Iterable
+from enum import IntEnum
+
+
+def bit_get(byte: int, position: int) -> int:
+    return (byte >> position) & 1
+
+
+def bit_set(byte: int, position: int, value: int) -> int:
+    mask = 1 << position
+
+    return byte | mask if value else byte & ~mask
+
+
+def set_bits(byte: int, mask: int, value: int) -> int:
+    return (byte & ~mask) | (value & mask)
+
+
+def pack_bits(bits: Iterable[tuple[IntEnum, int]]) -> int:
+    byte = 0
+
+    for bit, value in bits:
+        if value:
+            byte |= 1 << bit
+
+    return byte
+
+
+def unpack_bits(byte: int, bits: type[IntEnum]) -> dict[IntEnum, int]:
+    return {bit: (byte >> bit) & 1 for bit in bits}
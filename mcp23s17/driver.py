@@ -1,13 +1,141 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from dataclasses import dataclass
-from enum import auto, Enum, IntEnum
-from typing import cast, ClassVar
+from asyncio import get_running_loop
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import addressof, c_char
+from dataclasses import dataclass, field
+from enum import auto, IntEnum
+from fcntl import ioctl
+from functools import partial
+from struct import Struct
+from threading import Lock
+from typing import ClassVar
 from warnings import warn
 
 from periphery import GPIO, SPI
 
 
+class IO(IntEnum):
+    IO0 = 0
+    IO1 = 1
+    IO2 = 2
+    IO3 = 3
+    IO4 = 4
+    IO5 = 5
+    IO6 = 6
+    IO7 = 7
+
+
+class IP(IntEnum):
+    IP0 = 0
+    IP1 = 1
+    IP2 = 2
+    IP3 = 3
+    IP4 = 4
+    IP5 = 5
+    IP6 = 6
+    IP7 = 7
+
+
+class GPINT(IntEnum):
+    GPINT0 = 0
+    GPINT1 = 1
+    GPINT2 = 2
+    GPINT3 = 3
+    GPINT4 = 4
+    GPINT5 = 5
+    GPINT6 = 6
+    GPINT7 = 7
+
+
+class DEF(IntEnum):
+    DEF0 = 0
+    DEF1 = 1
+    DEF2 = 2
+    DEF3 = 3
+    DEF4 = 4
+    DEF5 = 5
+    DEF6 = 6
+    DEF7 = 7
+
+
+class IOC(IntEnum):
+    IOC0 = 0
+    IOC1 = 1
+    IOC2 = 2
+    IOC3 = 3
+    IOC4 = 4
+    IOC5 = 5
+    IOC6 = 6
+    IOC7 = 7
+
+
+class IOCON(IntEnum):
+    UNIMPLEMENTED = 0
+    INTPOL = 1
+    ODR = 2
+    HAEN = 3
+    DISSLW = 4
+    SEQOP = 5
+    MIRROR = 6
+    BANK = 7
+
+
+class PU(IntEnum):
+    PU0 = 0
+    PU1 = 1
+    PU2 = 2
+    PU3 = 3
+    PU4 = 4
+    PU5 = 5
+    PU6 = 6
+    PU7 = 7
+
+
+class INT(IntEnum):
+    INT0 = 0
+    INT1 = 1
+    INT2 = 2
+    INT3 = 3
+    INT4 = 4
+    INT5 = 5
+    INT6 = 6
+    INT7 = 7
+
+
+class ICP(IntEnum):
+    ICP0 = 0
+    ICP1 = 1
+    ICP2 = 2
+    ICP3 = 3
+    ICP4 = 4
+    ICP5 = 5
+    ICP6 = 6
+    ICP7 = 7
+
+
+class GP(IntEnum):
+    GP0 = 0
+    GP1 = 1
+    GP2 = 2
+    GP3 = 3
+    GP4 = 4
+    GP5 = 5
+    GP6 = 6
+    GP7 = 7
+
+
+class OL(IntEnum):
+    OL0 = 0
+    OL1 = 1
+    OL2 = 2
+    OL3 = 3
+    OL4 = 4
+    OL5 = 5
+    OL6 = 6
+    OL7 = 7
+
+
 @dataclass
 class MCP23S17:
     """A Python driver for Microchip Technology MCP23S17 16-Bit I/O
@@ -30,187 +158,64 @@ class MCP23S17:
         SIXTEEN_BIT_MODE = auto()
         """16-bit mode."""
 
-    class Register(Enum):
-        _ignore_ = '_Register'
-
-        class _Register(ABC):
-            BITS: ClassVar[type[IntEnum]]
-            ADDRESS: ClassVar[int]
-
-        class IODIR(_Register):
-            class IO(IntEnum):
-                IO0 = 0
-                IO1 = 1
-                IO2 = 2
-                IO3 = 3
-                IO4 = 4
-                IO5 = 5
-                IO6 = 6
-                IO7 = 7
-
-            BITS = IO
-            ADDRESS: ClassVar[int] = 0x00
-
-        class IPOL(_Register):
-            class IP(IntEnum):
-                IP0 = 0
-                IP1 = 1
-                IP2 = 2
-                IP3 = 3
-                IP4 = 4
-                IP5 = 5
-                IP6 = 6
-                IP7 = 7
-
-            BITS = IP
-            ADDRESS: ClassVar[int] = 0x01
-
-        class GPINTEN(_Register):
-            class GPINT(IntEnum):
-                GPINT0 = 0
-                GPINT1 = 1
-                GPINT2 = 2
-                GPINT3 = 3
-                GPINT4 = 4
-                GPINT5 = 5
-                GPINT6 = 6
-                GPINT7 = 7
-
-            BITS = GPINT
-            ADDRESS: ClassVar[int] = 0x02
-
-        class DEFVAL(_Register):
-            class DEF(IntEnum):
-                DEF0 = 0
-                DEF1 = 1
-                DEF2 = 2
-                DEF3 = 3
-                DEF4 = 4
-                DEF5 = 5
-                DEF6 = 6
-                DEF7 = 7
-
-            BITS = DEF
-            ADDRESS: ClassVar[int] = 0x03
-
-        class INTCON(_Register):
-            class IOC(IntEnum):
-                IOC0 = 0
-                IOC1 = 1
-                IOC2 = 2
-                IOC3 = 3
-                IOC4 = 4
-                IOC5 = 5
-                IOC6 = 6
-                IOC7 = 7
-
-            BITS = IOC
-            ADDRESS: ClassVar[int] = 0x04
-
-        class IOCON(_Register):
-            class BITS(IntEnum):
-                UNIMPLEMENTED = 0
-                INTPOL = 1
-                ODR = 2
-                HAEN = 3
-                DISSLW = 4
-                SEQOP = 5
-                MIRROR = 6
-                BANK = 7
-
-            ADDRESS: ClassVar[int] = 0x05
-
-        class GPPU(_Register):
-            class PU(IntEnum):
-                PU0 = 0
-                PU1 = 1
-                PU2 = 2
-                PU3 = 3
-                PU4 = 4
-                PU5 = 5
-                PU6 = 6
-                PU7 = 7
-
-            BITS = PU
-            ADDRESS: ClassVar[int] = 0x06
-
-        class INTF(_Register):
-            class INT(IntEnum):
-                INT0 = 0
-                INT1 = 1
-                INT2 = 2
-                INT3 = 3
-                INT4 = 4
-                INT5 = 5
-                INT6 = 6
-                INT7 = 7
-
-            BITS = INT
-            ADDRESS: ClassVar[int] = 0x07
-
-        class INTCAP(_Register):
-            class ICP(IntEnum):
-                ICP0 = 0
-                ICP1 = 1
-                ICP2 = 2
-                ICP3 = 3
-                ICP4 = 4
-                ICP5 = 5
-                ICP6 = 6
-                ICP7 = 7
-
-            BITS = ICP
-            ADDRESS: ClassVar[int] = 0x08
-
-        class GPIO(_Register):
-            class GP(IntEnum):
-                GP0 = 0
-                GP1 = 1
-                GP2 = 2
-                GP3 = 3
-                GP4 = 4
-                GP5 = 5
-                GP6 = 6
-                GP7 = 7
-
-            BITS = GP
-            ADDRESS: ClassVar[int] = 0x09
-
-        class OLAT(_Register):
-            class OL(IntEnum):
-                OL0 = 0
-                OL1 = 1
-                OL2 = 2
-                OL3 = 3
-                OL4 = 4
-                OL5 = 5
-                OL6 = 6
-                OL7 = 7
-
-            BITS = OL
-            ADDRESS: ClassVar[int] = 0x0A
+    class Register(IntEnum):
+        IODIR = 0x00
+        IPOL = 0x01
+        GPINTEN = 0x02
+        DEFVAL = 0x03
+        INTCON = 0x04
+        IOCON = 0x05
+        GPPU = 0x06
+        INTF = 0x07
+        INTCAP = 0x08
+        GPIO = 0x09
+        OLAT = 0x0A
 
         @property
         def bits(self) -> type[IntEnum]:
-            return cast(type[IntEnum], self.value.BITS)
+            return _REGISTER_BITS[self]
 
         @property
         def address(self) -> int:
-            return cast(int, self.value.ADDRESS)
+            return self.value
+
+        @property
+        def sixteen_bit_address(self) -> int:
+            return 2 * self.value
 
-    @dataclass
+    @dataclass(slots=True)
     class Operation(ABC):
         READ_OR_WRITE_BIT: ClassVar[int]
         hardware_address: int
         register_address: int
+        _control_byte: int = field(init=False, repr=False, compare=False)
+        _payload: bytes = field(init=False, repr=False, compare=False)
+        _transmitted_data: bytes = field(
+            init=False,
+            repr=False,
+            compare=False,
+        )
+
+        def __post_init__(self) -> None:
+            control_byte = _CONTROL_BYTES.get(
+                (self.hardware_address, self.READ_OR_WRITE_BIT),
+            )
+
+            if control_byte is None:
+                raise ValueError('unsupported hardware address')
+
+            self._control_byte = control_byte
+            self._transmitted_data = (
+                MCP23S17._HEADER.pack(
+                    self._control_byte,
+                    self.register_address,
+                )
+                + self._payload
+            )
 
         @property
         def control_byte(self) -> int:
-            return (
-                (MCP23S17.FIXED_BITS << MCP23S17.FIXED_BITS_OFFSET)
-                | (self.hardware_address << MCP23S17.CLIENT_ADDRESS_OFFSET)
-                | (self.READ_OR_WRITE_BIT << MCP23S17.READ_OR_WRITE_BIT_OFFSET)
-            )
+            return self._control_byte
 
         @property
         @abstractmethod
@@ -219,34 +224,61 @@ class MCP23S17:
 
         @property
         def transmitted_data(self) -> list[int]:
-            return [self.control_byte, self.register_address, *self.data_bytes]
+            return list(self._transmitted_data)
 
         @abstractmethod
-        def parse(self, received_data: list[int]) -> list[int] | None:
+        def parse(self, received_data: memoryview) -> memoryview | None:
             pass
 
-    @dataclass
+    @dataclass(slots=True)
     class Read(Operation):
         READ_OR_WRITE_BIT: ClassVar[int] = 1
         data_byte_count: int
 
+        def __post_init__(self) -> None:
+            payload = MCP23S17._FF_CACHE.get(self.data_byte_count)
+
+            if payload is None:
+                payload = (
+                    bytes(((1 << MCP23S17.SPI_WORD_BIT_COUNT) - 1,))
+                    * self.data_byte_count
+                )
+                MCP23S17._FF_CACHE[self.data_byte_count] = payload
+
+            self._payload = payload
+
+            super(MCP23S17.Read, self).__post_init__()
+
         @property
         def data_bytes(self) -> list[int]:
-            return (
-                [(1 << MCP23S17.SPI_WORD_BIT_COUNT) - 1] * self.data_byte_count
-            )
+            return list(self._payload)
 
-        def parse(self, received_data: list[int]) -> list[int]:
+        def parse(self, received_data: memoryview) -> memoryview:
             return received_data[-self.data_byte_count:]
 
-    @dataclass
+    @dataclass(slots=True)
     class Write(Operation):
         READ_OR_WRITE_BIT: ClassVar[int] = 0
         data_bytes: list[int]
 
-        def parse(self, received_data: list[int]) -> None:
+        def __post_init__(self) -> None:
+            self._payload = bytes(self.data_bytes)
+
+            super(MCP23S17.Write, self).__post_init__()
+
+        def parse(self, received_data: memoryview) -> None:
             return None
 
+    _FF_CACHE: ClassVar[dict[int, bytes]] = {}
+    """The cached dummy payloads for reads, keyed by byte count."""
+    SPI_BACKENDS: ClassVar[tuple[str, str]] = 'periphery', 'ioctl'
+    """The supported spi transfer backends."""
+    SPI_IOC_MESSAGE_1: ClassVar[int] = 0x40206B00
+    """The SPI_IOC_MESSAGE(1) ioctl request code."""
+    _SPI_IOC_TRANSFER: ClassVar[Struct] = Struct('QQIIHBBBBBB')
+    """The struct spi_ioc_transfer layout."""
+    _HEADER: ClassVar[Struct] = Struct('BB')
+    """The control byte and register address header layout."""
     SPI_MODES: ClassVar[tuple[int, int]] = 0b00, 0b11
     """The supported spi modes."""
     MAX_SPI_MAX_SPEED: ClassVar[float] = 10e6
@@ -263,6 +295,8 @@ class MCP23S17:
     """The client address offset."""
     READ_OR_WRITE_BIT_OFFSET: ClassVar[int] = 0
     """The R/W bit offset."""
+    PORT_B_ADDRESS_FLAG: ClassVar[int] = 0x10
+    """The PORTB register address flag (banked addressing)."""
     hardware_reset_gpio: GPIO
     """The hardware reset GPIO."""
     interrupt_output_a_gpio: GPIO
@@ -273,38 +307,435 @@ class MCP23S17:
     """The SPI."""
     callback: Callable[[Port], None]
     """The callback function."""
+    spi_backend: str = 'periphery'
+    """The spi transfer backend."""
+    _seqop_enabled: bool = field(default=True, init=False, repr=False)
+    """Whether sequential operation (IOCON.SEQOP) is enabled."""
+    _bank_enabled: bool = field(default=False, init=False, repr=False)
+    """Whether banked addressing (IOCON.BANK) is enabled."""
+    _tx_buffer: bytearray = field(
+        default_factory=bytearray,
+        init=False,
+        repr=False,
+    )
+    """The reusable ioctl transmit buffer."""
+    _rx_buffer: bytearray = field(
+        default_factory=bytearray,
+        init=False,
+        repr=False,
+    )
+    """The reusable ioctl receive buffer."""
+    _message_buffer: bytearray = field(
+        default_factory=lambda: bytearray(MCP23S17._SPI_IOC_TRANSFER.size),
+        init=False,
+        repr=False,
+    )
+    """The reusable struct spi_ioc_transfer buffer."""
+    _spi_executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(max_workers=1),
+        init=False,
+        repr=False,
+    )
+    """The single-worker executor running operate_async calls."""
+    _spi_lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    """The lock serializing spi bus access and driver state."""
 
     def __post_init__(self) -> None:
-        if self.spi.mode not in self.SPI_MODES:
+        spi_mode = self.spi.mode
+        spi_max_speed = self.spi.max_speed
+        spi_bit_order = self.spi.bit_order
+        spi_word_bit_count = self.spi.bits_per_word
+        spi_extra_flags = self.spi.extra_flags
+
+        if spi_mode not in self.SPI_MODES:
             raise ValueError('unsupported spi mode')
-        elif self.spi.max_speed > self.MAX_SPI_MAX_SPEED:
+        elif spi_max_speed > self.MAX_SPI_MAX_SPEED:
             raise ValueError('unsupported spi maximum speed')
-        elif self.spi.bit_order != self.SPI_BIT_ORDER:
+        elif spi_bit_order != self.SPI_BIT_ORDER:
             raise ValueError('unsupported spi bit order')
-        elif self.spi.bits_per_word != self.SPI_WORD_BIT_COUNT:
+        elif spi_word_bit_count != self.SPI_WORD_BIT_COUNT:
             raise ValueError('unsupported spi number of bits per word')
 
-        if self.spi.extra_flags:
-            warn(f'unknown spi extra flags {self.spi.extra_flags}')
-
-    def operate(self, *operations: Operation) -> list[list[int] | None]:
-        transmitted_data = []
+        if self.spi_backend not in self.SPI_BACKENDS:
+            raise ValueError('unsupported spi backend')
+
+        if spi_extra_flags:
+            warn(f'unknown spi extra flags {spi_extra_flags}')
+
+    def close(self) -> None:
+        self._spi_executor.shutdown()
+
+    def _transfer(self, transmitted_data: bytes) -> bytes | bytearray:
+        if self.spi_backend == 'periphery':
+            received_data = self.spi.transfer(transmitted_data)
+
+            assert isinstance(received_data, (bytes, bytearray))
+
+            return received_data
+
+        size = len(transmitted_data)
+
+        if len(self._tx_buffer) < size:
+            self._tx_buffer = bytearray(size)
+
+        if len(self._rx_buffer) < size:
+            self._rx_buffer = bytearray(size)
+
+        self._tx_buffer[:size] = transmitted_data
+
+        self._SPI_IOC_TRANSFER.pack_into(
+            self._message_buffer,
+            0,
+            addressof((c_char * size).from_buffer(self._tx_buffer)),
+            addressof((c_char * size).from_buffer(self._rx_buffer)),
+            size,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+        )
+        ioctl(self.spi.fd, self.SPI_IOC_MESSAGE_1, self._message_buffer)
+
+        return self._rx_buffer[:size]
+
+    @classmethod
+    def _iocon_addresses(cls, bank_enabled: bool) -> tuple[int, int]:
+        if bank_enabled:
+            address = cls.Register.IOCON.address
+
+            return address, cls.PORT_B_ADDRESS_FLAG | address
+
+        address = cls.Register.IOCON.sixteen_bit_address
+
+        return address, address + 1
+
+    @classmethod
+    def _touches_iocon(
+            cls,
+            operation: Operation,
+            bank_enabled: bool,
+    ) -> bool:
+        begin = operation.register_address
+        end = begin + len(operation._payload)
+
+        return any(
+            begin <= address < end
+            for address in cls._iocon_addresses(bank_enabled)
+        )
+
+    @classmethod
+    def _status_after(
+            cls,
+            operation: Operation,
+            seqop_enabled: bool,
+            bank_enabled: bool,
+    ) -> tuple[bool, bool]:
+        if not isinstance(operation, MCP23S17.Write):
+            return seqop_enabled, bank_enabled
+
+        begin = operation.register_address
+        end = begin + len(operation._payload)
+
+        for address in cls._iocon_addresses(bank_enabled):
+            if begin <= address < end:
+                iocon_value = operation.data_bytes[address - begin]
+                seqop_enabled = not (
+                    iocon_value & (1 << cls.Register.IOCON.bits['SEQOP'])
+                )
+                bank_enabled = bool(
+                    iocon_value & (1 << cls.Register.IOCON.bits['BANK']),
+                )
+
+        return seqop_enabled, bank_enabled
+
+    def _coalesce(
+            self,
+            operations: tuple[Operation, ...],
+    ) -> list[tuple[Operation, list[Operation]]]:
+        seqop_enabled = self._seqop_enabled
+        bank_enabled = self._bank_enabled
+        groups: list[
+            tuple[MCP23S17.Operation, list[MCP23S17.Operation]]
+        ] = []
 
         for operation in operations:
-            transmitted_data.extend(operation.transmitted_data)
+            touches_iocon = (
+                isinstance(operation, MCP23S17.Write)
+                and self._touches_iocon(operation, bank_enabled)
+            )
 
-        received_data = self.spi.transfer(transmitted_data)
+            if groups:
+                merged_operation, merged_operations = groups[-1]
+                mergeable = (
+                    seqop_enabled
+                    and not touches_iocon
+                    and not (
+                        isinstance(merged_operation, MCP23S17.Write)
+                        and self._touches_iocon(merged_operation, bank_enabled)
+                    )
+                    and type(operation) is type(merged_operation)
+                    and (
+                        operation.hardware_address
+                        == merged_operation.hardware_address
+                    )
+                    and operation.register_address == (
+                        merged_operation.register_address
+                        + len(merged_operation._payload)
+                    )
+                )
+            else:
+                mergeable = False
+
+            if mergeable:
+                if isinstance(operation, MCP23S17.Write):
+                    assert isinstance(merged_operation, MCP23S17.Write)
+
+                    merged_operation = MCP23S17.Write(
+                        merged_operation.hardware_address,
+                        merged_operation.register_address,
+                        merged_operation.data_bytes + operation.data_bytes,
+                    )
+                else:
+                    assert isinstance(operation, MCP23S17.Read)
+                    assert isinstance(merged_operation, MCP23S17.Read)
+
+                    merged_operation = MCP23S17.Read(
+                        merged_operation.hardware_address,
+                        merged_operation.register_address,
+                        (
+                            merged_operation.data_byte_count
+                            + operation.data_byte_count
+                        ),
+                    )
+
+                merged_operations.append(operation)
+
+                groups[-1] = merged_operation, merged_operations
+            else:
+                groups.append((operation, [operation]))
+
+            seqop_enabled, bank_enabled = self._status_after(
+                operation,
+                seqop_enabled,
+                bank_enabled,
+            )
 
-        assert isinstance(received_data, list)
+        self._seqop_enabled = seqop_enabled
+        self._bank_enabled = bank_enabled
+
+        return groups
+
+    def operate_repeated(
+            self,
+            operation: Operation,
+            count: int,
+            copy: bool = False,
+    ) -> list[list[int] | memoryview | None]:
+        """Transfer ``count`` back-to-back repetitions of an operation
+        as a single spi transfer.
+
+        The repetitions share one chip-select-low window when the
+        chip-select line is hardware-controlled. Multi-byte operations
+        rely on sequential operation (IOCON.SEQOP clear, the power-on
+        reset default); a ValueError is raised when the tracked state
+        says it is disabled.
+        """
+        template = operation._transmitted_data
+
+        with self._spi_lock:
+            if len(operation._payload) > 1 and not self._seqop_enabled:
+                raise ValueError('sequential operation disabled')
+
+            received_data = self._transfer(template * count)
+            self._seqop_enabled, self._bank_enabled = self._status_after(
+                operation,
+                self._seqop_enabled,
+                self._bank_enabled,
+            )
 
-        parsed_data = []
-        begin = 0
+        if not isinstance(operation, MCP23S17.Read):
+            return [None] * count
 
-        for operation in operations:
-            end = begin + len(operation.transmitted_data)
+        received_view = memoryview(received_data)
+        size = len(template)
+        parsed_data: list[list[int] | memoryview | None] = []
 
-            parsed_data.append(operation.parse(received_data[begin:end]))
+        for offset in range(0, size * count, size):
+            data = received_view[offset + 2:offset + size]
 
-            begin = end
+            parsed_data.append(data.tolist() if copy else data)
 
         return parsed_data
+
+    async def operate_async(
+            self,
+            *operations: Operation,
+            copy: bool = False,
+    ) -> list[list[int] | memoryview | None]:
+        return await get_running_loop().run_in_executor(
+            self._spi_executor,
+            partial(self.operate, *operations, copy=copy),
+        )
+
+    def operate(
+            self,
+            *operations: Operation,
+            copy: bool = False,
+    ) -> list[list[int] | memoryview | None]:
+        with self._spi_lock:
+            groups = self._coalesce(operations)
+            transmitted_data = b''.join(
+                merged_operation._transmitted_data
+                for merged_operation, _ in groups
+            )
+            read_slices: list[tuple[int, int, int]] = []
+            index = 0
+            offset = 0
+
+            for merged_operation, merged_operations in groups:
+                if isinstance(merged_operation, MCP23S17.Read):
+                    data_offset = offset + 2
+
+                    for operation in merged_operations:
+                        assert isinstance(operation, MCP23S17.Read)
+
+                        read_slices.append(
+                            (
+                                index,
+                                data_offset,
+                                data_offset + operation.data_byte_count,
+                            ),
+                        )
+
+                        data_offset += operation.data_byte_count
+                        index += 1
+                else:
+                    index += len(merged_operations)
+
+                offset += len(merged_operation._transmitted_data)
+
+            received_view = memoryview(self._transfer(transmitted_data))
+        parsed_data: list[list[int] | memoryview | None] = (
+            [None] * len(operations)
+        )
+
+        if copy:
+            for index, begin, end in read_slices:
+                parsed_data[index] = received_view[begin:end].tolist()
+        else:
+            for index, begin, end in read_slices:
+                parsed_data[index] = received_view[begin:end]
+
+        return parsed_data
+
+    def _check_sixteen_bit_access(self) -> None:
+        if self._bank_enabled:
+            raise ValueError('banked addressing enabled')
+        elif not self._seqop_enabled:
+            raise ValueError('sequential operation disabled')
+
+    def sample_all(
+            self,
+            hardware_addresses: Iterable[int],
+    ) -> list[tuple[int, int]]:
+        """Sample GPIOA and GPIOB of every addressed chip in a single
+        spi transfer.
+
+        This relies on the power-on reset register layout: banked
+        addressing disabled (IOCON.BANK clear) and sequential operation
+        enabled (IOCON.SEQOP clear). A ValueError is raised when the
+        tracked state contradicts either.
+        """
+        self._check_sixteen_bit_access()
+
+        transmitted_data = b''.join(
+            self.Read(
+                hardware_address,
+                self.Register.GPIO.sixteen_bit_address,
+                2,
+            )._transmitted_data
+            for hardware_address in hardware_addresses
+        )
+
+        with self._spi_lock:
+            received_view = memoryview(self._transfer(transmitted_data))
+
+        samples = []
+
+        for offset in range(0, len(transmitted_data), 4):
+            samples.append(
+                (received_view[offset + 2], received_view[offset + 3]),
+            )
+
+        return samples
+
+    def read_gpio16(self, hardware_address: int) -> int:
+        """Read PORTA and PORTB as a single sixteen-bit value (PORTA in
+        the low byte).
+
+        Like sample_all, this requires the power-on reset defaults of
+        IOCON.BANK and IOCON.SEQOP both clear and raises ValueError
+        otherwise.
+        """
+        self._check_sixteen_bit_access()
+
+        data = self.operate(
+            self.Read(
+                hardware_address,
+                self.Register.GPIO.sixteen_bit_address,
+                2,
+            ),
+        )[0]
+
+        assert data is not None
+
+        return data[0] | (data[1] << self.SPI_WORD_BIT_COUNT)
+
+    def write_gpio16(self, hardware_address: int, value: int) -> None:
+        """Write PORTA and PORTB from a single sixteen-bit value (PORTA
+        from the low byte).
+
+        Like sample_all, this requires the power-on reset defaults of
+        IOCON.BANK and IOCON.SEQOP both clear and raises ValueError
+        otherwise.
+        """
+        self._check_sixteen_bit_access()
+
+        mask = (1 << self.SPI_WORD_BIT_COUNT) - 1
+
+        self.operate(
+            self.Write(
+                hardware_address,
+                self.Register.GPIO.sixteen_bit_address,
+                [value & mask, (value >> self.SPI_WORD_BIT_COUNT) & mask],
+            ),
+        )
+
+
+_CONTROL_BYTES: dict[tuple[int, int], int] = {
+    (hardware_address, read_or_write_bit): (
+        (MCP23S17.FIXED_BITS << MCP23S17.FIXED_BITS_OFFSET)
+        | (hardware_address << MCP23S17.CLIENT_ADDRESS_OFFSET)
+        | (read_or_write_bit << MCP23S17.READ_OR_WRITE_BIT_OFFSET)
+    )
+    for hardware_address in range(1 << 3)
+    for read_or_write_bit in range(2)
+}
+
+_REGISTER_BITS: dict[MCP23S17.Register, type[IntEnum]] = {
+    MCP23S17.Register.IODIR: IO,
+    MCP23S17.Register.IPOL: IP,
+    MCP23S17.Register.GPINTEN: GPINT,
+    MCP23S17.Register.DEFVAL: DEF,
+    MCP23S17.Register.INTCON: IOC,
+    MCP23S17.Register.IOCON: IOCON,
+    MCP23S17.Register.GPPU: PU,
+    MCP23S17.Register.INTF: INT,
+    MCP23S17.Register.INTCAP: ICP,
+    MCP23S17.Register.GPIO: GP,
+    MCP23S17.Register.OLAT: OL,
+}
@@ -0,0 +1,55 @@
+from unittest import main, TestCase
+
+from mcp23s17.bits import bit_get, bit_set, pack_bits, set_bits, unpack_bits
+from mcp23s17.driver import IOCON
+
+
+class BitsTestCase(TestCase):
+    def test_bit_get(self) -> None:
+        self.assertEqual(bit_get(0b1010, 0), 0)
+        self.assertEqual(bit_get(0b1010, 1), 1)
+        self.assertEqual(bit_get(0b1010, 3), 1)
+        self.assertEqual(bit_get(0b1010, 7), 0)
+
+    def test_bit_set(self) -> None:
+        self.assertEqual(bit_set(0b0000, 3, 1), 0b1000)
+        self.assertEqual(bit_set(0b1111, 0, 0), 0b1110)
+        self.assertEqual(bit_set(0b1000, 3, 1), 0b1000)
+        self.assertEqual(bit_set(0b0000, 0, 0), 0b0000)
+
+    def test_set_bits(self) -> None:
+        self.assertEqual(set_bits(0b1010, 0b0110, 0b0100), 0b1100)
+        self.assertEqual(set_bits(0xFF, 0x0F, 0x00), 0xF0)
+        self.assertEqual(set_bits(0x00, 0xF0, 0xFF), 0xF0)
+
+    def test_pack_bits(self) -> None:
+        self.assertEqual(
+            pack_bits([(IOCON.SEQOP, 1), (IOCON.HAEN, 1), (IOCON.BANK, 0)]),
+            0b00101000,
+        )
+
+    def test_unpack_bits(self) -> None:
+        self.assertEqual(
+            unpack_bits(0b00101000, IOCON),
+            {
+                IOCON.UNIMPLEMENTED: 0,
+                IOCON.INTPOL: 0,
+                IOCON.ODR: 0,
+                IOCON.HAEN: 1,
+                IOCON.DISSLW: 0,
+                IOCON.SEQOP: 1,
+                IOCON.MIRROR: 0,
+                IOCON.BANK: 0,
+            },
+        )
+
+    def test_round_trip(self) -> None:
+        for byte in 0b00000000, 0b10100101, 0b11111111:
+            self.assertEqual(
+                pack_bits(unpack_bits(byte, IOCON).items()),
+                byte,
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,392 @@
+from asyncio import get_running_loop
+from ctypes import memmove, string_at
+from struct import unpack_from
+from threading import Lock
+from time import sleep
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, main, TestCase
+from unittest.mock import MagicMock, patch
+
+from mcp23s17 import driver
+from mcp23s17.driver import MCP23S17
+
+
+class MCP23S17TestCase(TestCase):
+    def create_driver(self, spi_backend: str = 'periphery') -> MCP23S17:
+        self.transfer_log: list[list[int]] = []
+
+        def transfer(data: bytes) -> bytes:
+            self.transfer_log.append(list(data))
+
+            return bytes(byte ^ 0xFF for byte in data)
+
+        spi = MagicMock()
+        spi.mode = 0b00
+        spi.max_speed = 1e6
+        spi.bit_order = 'msb'
+        spi.bits_per_word = 8
+        spi.extra_flags = 0
+        spi.fd = 3
+        spi.transfer = transfer
+
+        return MCP23S17(
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            spi,
+            MagicMock(),
+            spi_backend,
+        )
+
+
+class ValidationTestCase(MCP23S17TestCase):
+    def test_unsupported_spi_mode(self) -> None:
+        driver_ = self.create_driver()
+        driver_.spi.mode = 0b01
+
+        self.assertRaises(
+            ValueError,
+            MCP23S17,
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            driver_.spi,
+            MagicMock(),
+        )
+
+    def test_unsupported_spi_backend(self) -> None:
+        driver_ = self.create_driver()
+
+        self.assertRaises(
+            ValueError,
+            MCP23S17,
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            driver_.spi,
+            MagicMock(),
+            'bogus',
+        )
+
+    def test_unsupported_hardware_address(self) -> None:
+        self.assertRaises(ValueError, MCP23S17.Read, 8, 0x00, 1)
+        self.assertRaises(ValueError, MCP23S17.Write, -1, 0x00, [0])
+
+
+class OperationTestCase(MCP23S17TestCase):
+    def test_control_byte(self) -> None:
+        self.assertEqual(MCP23S17.Read(0, 0x00, 1).control_byte, 0x41)
+        self.assertEqual(MCP23S17.Read(7, 0x00, 1).control_byte, 0x4F)
+        self.assertEqual(MCP23S17.Write(0, 0x00, [0]).control_byte, 0x40)
+        self.assertEqual(MCP23S17.Write(3, 0x00, [0]).control_byte, 0x46)
+
+    def test_transmitted_data(self) -> None:
+        self.assertEqual(
+            MCP23S17.Read(0, 0x09, 2).transmitted_data,
+            [0x41, 0x09, 0xFF, 0xFF],
+        )
+        self.assertEqual(
+            MCP23S17.Write(1, 0x00, [0xAA, 0xBB]).transmitted_data,
+            [0x42, 0x00, 0xAA, 0xBB],
+        )
+
+    def test_keyword_construction(self) -> None:
+        write = MCP23S17.Write(
+            hardware_address=0,
+            register_address=1,
+            data_bytes=[2],
+        )
+
+        self.assertEqual(write.data_bytes, [2])
+        self.assertNotIn('_data_bytes', repr(write))
+
+
+class OperateTestCase(MCP23S17TestCase):
+    def test_coalesced_writes(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = driver_.operate(
+            MCP23S17.Write(0, 0x00, [0xAA]),
+            MCP23S17.Write(0, 0x01, [0xBB]),
+        )
+
+        self.assertEqual(parsed_data, [None, None])
+        self.assertEqual(self.transfer_log, [[0x40, 0x00, 0xAA, 0xBB]])
+
+    def test_coalesced_reads(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = driver_.operate(
+            MCP23S17.Read(0, 0x09, 1),
+            MCP23S17.Read(0, 0x0A, 1),
+            copy=True,
+        )
+
+        self.assertEqual(parsed_data, [[0x00], [0x00]])
+        self.assertEqual(self.transfer_log, [[0x41, 0x09, 0xFF, 0xFF]])
+
+    def test_uncoalesced_operations(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = driver_.operate(
+            MCP23S17.Write(1, 0x00, [0x11]),
+            MCP23S17.Write(2, 0x01, [0x22]),
+            MCP23S17.Read(1, 0x01, 2),
+            MCP23S17.Write(1, 0x03, [0x33]),
+            copy=True,
+        )
+
+        self.assertEqual(parsed_data, [None, None, [0x00, 0x00], None])
+        self.assertEqual(
+            self.transfer_log,
+            [
+                [
+                    0x42, 0x00, 0x11,
+                    0x44, 0x01, 0x22,
+                    0x43, 0x01, 0xFF, 0xFF,
+                    0x42, 0x03, 0x33,
+                ],
+            ],
+        )
+
+    def test_seqop_tracking(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.operate(
+            MCP23S17.Write(0, 0x08, [0xAA]),
+            MCP23S17.Write(0, 0x0A, [1 << 5]),
+            MCP23S17.Write(0, 0x0C, [0xCC]),
+            MCP23S17.Write(0, 0x0D, [0xDD]),
+        )
+        self.assertFalse(driver_._seqop_enabled)
+        self.assertEqual(
+            self.transfer_log,
+            [
+                [
+                    0x40, 0x08, 0xAA,
+                    0x40, 0x0A, 0x20,
+                    0x40, 0x0C, 0xCC,
+                    0x40, 0x0D, 0xDD,
+                ],
+            ],
+        )
+
+        driver_.operate(MCP23S17.Write(0, 0x0A, [0x00]))
+        self.assertTrue(driver_._seqop_enabled)
+
+    def test_seqop_tracking_ignores_non_iocon_writes(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.operate(MCP23S17.Write(0, 0x04, [0x20, 0x20]))
+        self.assertTrue(driver_._seqop_enabled)
+
+        driver_.operate(
+            MCP23S17.Write(0, 0x12, [0x11]),
+            MCP23S17.Write(0, 0x13, [0x22]),
+        )
+        self.assertEqual(
+            self.transfer_log,
+            [
+                [0x40, 0x04, 0x20, 0x20],
+                [0x40, 0x12, 0x11, 0x22],
+            ],
+        )
+
+    def test_bank_tracking(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.operate(MCP23S17.Write(0, 0x0A, [1 << 7]))
+        self.assertTrue(driver_._bank_enabled)
+
+        driver_.operate(MCP23S17.Write(0, 0x05, [1 << 5]))
+        self.assertFalse(driver_._seqop_enabled)
+        self.assertFalse(driver_._bank_enabled)
+
+    def test_memoryview_results(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = driver_.operate(MCP23S17.Read(0, 0x09, 2))
+
+        data = parsed_data[0]
+
+        assert isinstance(data, memoryview)
+
+        self.assertEqual(data.tolist(), [0x00, 0x00])
+
+        parsed_data = driver_.operate(MCP23S17.Read(0, 0x09, 2), copy=True)
+
+        self.assertIsInstance(parsed_data[0], list)
+
+
+class OperateRepeatedTestCase(MCP23S17TestCase):
+    def test_read(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = driver_.operate_repeated(
+            MCP23S17.Read(0, 0x09, 2),
+            3,
+            copy=True,
+        )
+
+        self.assertEqual(parsed_data, [[0x00, 0x00]] * 3)
+        self.assertEqual(self.transfer_log, [[0x41, 0x09, 0xFF, 0xFF] * 3])
+
+    def test_write(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = driver_.operate_repeated(
+            MCP23S17.Write(0, 0x0A, [0x42]),
+            2,
+        )
+
+        self.assertEqual(parsed_data, [None, None])
+        self.assertEqual(self.transfer_log, [[0x40, 0x0A, 0x42] * 2])
+
+    def test_seqop_tracking(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.operate_repeated(MCP23S17.Write(0, 0x0A, [1 << 5]), 1)
+        self.assertFalse(driver_._seqop_enabled)
+
+        driver_.operate_repeated(MCP23S17.Write(0, 0x0A, [0x00]), 2)
+        self.assertTrue(driver_._seqop_enabled)
+
+    def test_sequential_operation_disabled(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.operate_repeated(MCP23S17.Write(0, 0x0A, [1 << 5]), 1)
+        self.assertRaises(
+            ValueError,
+            driver_.operate_repeated,
+            MCP23S17.Read(0, 0x12, 2),
+            3,
+        )
+
+
+class IoctlBackendTestCase(MCP23S17TestCase):
+    def test_transfer(self) -> None:
+        driver_ = self.create_driver('ioctl')
+        requests: list[int] = []
+
+        def fake_ioctl(fd: int, request: int, buffer: bytearray) -> int:
+            self.assertEqual(fd, 3)
+            requests.append(request)
+
+            tx_buf, rx_buf, size, *tail = unpack_from('QQIIHBBBBBB', buffer)
+
+            self.assertEqual(tail, [0] * 8)
+            memmove(
+                rx_buf,
+                bytes(byte ^ 0xFF for byte in string_at(tx_buf, size)),
+                size,
+            )
+
+            return 0
+
+        with patch.object(driver, 'ioctl', fake_ioctl):
+            parsed_data = driver_.operate(MCP23S17.Read(0, 0x09, 2), copy=True)
+
+        self.assertEqual(requests, [MCP23S17.SPI_IOC_MESSAGE_1])
+        self.assertEqual(parsed_data, [[0x00, 0x00]])
+
+
+class OperateAsyncTestCase(MCP23S17TestCase, IsolatedAsyncioTestCase):
+    async def test_operate_async(self) -> None:
+        driver_ = self.create_driver()
+        parsed_data = await driver_.operate_async(
+            MCP23S17.Read(0, 0x00, 1),
+            MCP23S17.Read(0, 0x01, 1),
+            copy=True,
+        )
+
+        self.assertEqual(parsed_data, [[0x00], [0x00]])
+        self.assertEqual(self.transfer_log, [[0x41, 0x00, 0xFF, 0xFF]])
+
+    async def test_sync_and_async_serialization(self) -> None:
+        driver_ = self.create_driver()
+        lock = Lock()
+        active = 0
+        max_active = 0
+        transfer = cast(Any, driver_.spi).transfer
+
+        def slow_transfer(data: bytes) -> bytes:
+            nonlocal active, max_active
+
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+
+            sleep(0.01)
+
+            with lock:
+                active -= 1
+
+            return cast(bytes, transfer(data))
+
+        cast(Any, driver_.spi).transfer = slow_transfer
+
+        future = get_running_loop().run_in_executor(
+            None,
+            driver_.operate,
+            MCP23S17.Write(0, 0x00, [0x11]),
+        )
+
+        await driver_.operate_async(MCP23S17.Write(0, 0x01, [0x22]))
+        await future
+
+        self.assertEqual(max_active, 1)
+        self.assertCountEqual(
+            self.transfer_log,
+            [[0x40, 0x00, 0x11], [0x40, 0x01, 0x22]],
+        )
+
+    async def test_close(self) -> None:
+        driver_ = self.create_driver()
+
+        await driver_.operate_async(MCP23S17.Write(0, 0x00, [0xAA]))
+        driver_.close()
+
+        self.assertRaises(
+            RuntimeError,
+            driver_._spi_executor.submit,
+            driver_.operate,
+        )
+
+
+class HighLevelTestCase(MCP23S17TestCase):
+    def test_read_gpio16(self) -> None:
+        driver_ = self.create_driver()
+        value = driver_.read_gpio16(0)
+
+        self.assertEqual(self.transfer_log, [[0x41, 0x12, 0xFF, 0xFF]])
+        self.assertEqual(value, 0x0000)
+
+    def test_write_gpio16(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.write_gpio16(0, 0xBEEF)
+        self.assertEqual(self.transfer_log, [[0x40, 0x12, 0xEF, 0xBE]])
+
+    def test_sixteen_bit_access_preconditions(self) -> None:
+        driver_ = self.create_driver()
+
+        driver_.operate(MCP23S17.Write(0, 0x0A, [1 << 5]))
+        self.assertRaises(ValueError, driver_.read_gpio16, 0)
+        self.assertRaises(ValueError, driver_.write_gpio16, 0, 0xBEEF)
+
+        driver_.operate(MCP23S17.Write(0, 0x0A, [1 << 7]))
+        self.assertRaises(ValueError, driver_.sample_all, [0])
+
+    def test_sample_all(self) -> None:
+        driver_ = self.create_driver()
+        samples = driver_.sample_all([0, 3, 7])
+
+        self.assertEqual(samples, [(0, 0)] * 3)
+        self.assertEqual(
+            self.transfer_log,
+            [
+                [
+                    0x41, 0x12, 0xFF, 0xFF,
+                    0x47, 0x12, 0xFF, 0xFF,
+                    0x4F, 0x12, 0xFF, 0xFF,
+                ],
+            ],
+        )
+
+
+if __name__ == '__main__':
+    main()